@@ -20,6 +20,15 @@ const RSS_FEEDS = {
   cnbctv18: 'https://www.cnbctv18.com/commonfeeds/v1/eng/rss/markets.xml'
 };
 
+// Feed list with display names, derived once from RSS_FEEDS
+const FEED_SOURCES = Object.entries(RSS_FEEDS).map(([source, url]) => ({
+  url,
+  sourceName: source.charAt(0).toUpperCase() + source.slice(1)
+}));
+
+// Upper bound for a single feed request so one slow source cannot stall a refresh
+const FEED_TIMEOUT = 10 * 1000;
+
 // Mock data for fallback
 const MOCK_NEWS = [
   {
@@ -59,10 +68,40 @@ const MOCK_NEWS = [
   }
 ];
 
+// Longest summary sent to the client; news cards only show the first 150 characters
+const SUMMARY_MAX_LENGTH = 300;
+
+// HTML tags and comments; a bare '<' or '>' in plain text is left alone
+const HTML_MARKUP = /<\/?[a-zA-Z][^>]*>|<!--[\s\S]*?-->/g;
+
+// Strip markup from feed descriptions, keeping the full text for filtering and scoring
+function cleanSummary(text) {
+  if (typeof text !== 'string') return 'No summary available';
+  
+  const plainText = text.replace(HTML_MARKUP, ' ').replace(/\s+/g, ' ').trim();
+  return plainText || 'No summary available';
+}
+
+// Cap an article's summary length for API responses, cutting between words
+function withShortSummary(item) {
+  const summary = item.summary;
+  if (summary.length <= SUMMARY_MAX_LENGTH) return item;
+  
+  let cut = summary.lastIndexOf(' ', SUMMARY_MAX_LENGTH);
+  if (cut <= 0) {
+    // No space to break at; avoid splitting a surrogate pair
+    const lastCode = summary.charCodeAt(SUMMARY_MAX_LENGTH - 1);
+    cut = lastCode >= 0xD800 && lastCode <= 0xDBFF ? SUMMARY_MAX_LENGTH - 1 : SUMMARY_MAX_LENGTH;
+  }
+  
+  return { ...item, summary: summary.slice(0, cut).trim() + '...' };
+}
+
 // Helper function to parse RSS feed
 async function parseRSSFeed(url, sourceName) {
   try {
     const response = await fetch(url, {
+      timeout: FEED_TIMEOUT,
       headers: {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
       }
@@ -80,7 +119,7 @@ async function parseRSSFeed(url, sourceName) {
     
     return items.slice(0, 10).map(item => ({
       title: item.title?.[0] || item.title?._ || 'No title',
-      summary: item.description?.[0] || item.summary?.[0] || 'No summary available',
+      summary: cleanSummary(item.description?.[0] || item.summary?.[0]),
       source: sourceName,
       pubDate: item.pubDate?.[0] || item.published?.[0] || new Date().toISOString(),
       link: item.link?.[0] || item.link?.$.href || '#'
@@ -91,65 +130,103 @@ async function parseRSSFeed(url, sourceName) {
   }
 }
 
+// Keyword lists used for filtering and trending, built once at startup
+const FINANCE_KEYWORDS = [
+  'market', 'stock', 'share', 'equity', 'bond', 'nse', 'bse', 'sensex', 'nifty',
+  'rupee', 'dollar', 'forex', 'rbi', 'interest rate', 'earnings', 'profit',
+  'revenue', 'ipo', 'trading', 'investment', 'mutual fund', 'banking', 'finance',
+  'economy', 'inflation', 'gdp', 'fiscal', 'monetary', 'corporate', 'dividend'
+];
+
+const CRYPTO_KEYWORDS = ['bitcoin', 'crypto', 'cryptocurrency', 'blockchain', 'ethereum'];
+
+const TRENDING_KEYWORDS = ['sensex', 'nifty', 'rbi', 'earnings', 'ipo', 'rupee'];
+
+// Compile a keyword list into one case-insensitive pattern matching any of them
+function keywordPattern(keywords) {
+  const escaped = keywords.map(keyword => keyword.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'));
+  return new RegExp(escaped.join('|'), 'i');
+}
+
+const FINANCE_PATTERN = keywordPattern(FINANCE_KEYWORDS);
+const CRYPTO_PATTERN = keywordPattern(CRYPTO_KEYWORDS);
+
 // Filter function to check if news is finance-related
 function isFinanceRelated(title, summary) {
-  const financeKeywords = [
-    'market', 'stock', 'share', 'equity', 'bond', 'nse', 'bse', 'sensex', 'nifty',
-    'rupee', 'dollar', 'forex', 'rbi', 'interest rate', 'earnings', 'profit',
-    'revenue', 'ipo', 'trading', 'investment', 'mutual fund', 'banking', 'finance',
-    'economy', 'inflation', 'gdp', 'fiscal', 'monetary', 'corporate', 'dividend'
-  ];
-  
-  const cryptoKeywords = ['bitcoin', 'crypto', 'cryptocurrency', 'blockchain', 'ethereum'];
-  
-  const text = (title + ' ' + summary).toLowerCase();
+  const text = title + ' ' + summary;
   
   // Exclude crypto news
-  if (cryptoKeywords.some(keyword => text.includes(keyword))) {
+  if (CRYPTO_PATTERN.test(text)) {
     return false;
   }
   
   // Include finance-related news
-  return financeKeywords.some(keyword => text.includes(keyword));
+  return FINANCE_PATTERN.test(text);
+}
+
+// Aggregate finance news from all RSS feeds
+async function getFinanceNews() {
+  // Fetch from all RSS feeds concurrently
+  const feedResults = await Promise.all(
+    FEED_SOURCES.map(({ url, sourceName }) => parseRSSFeed(url, sourceName))
+  );
+  const allNews = feedResults.flat();
+  
+  // Filter for finance-related news only
+  const financeNews = allNews.filter(item => 
+    isFinanceRelated(item.title, item.summary)
+  );
+  
+  // If no news fetched, use mock data
+  const newsToReturn = financeNews.length > 0 ? financeNews : MOCK_NEWS;
+  
+  // Parse each publication date once for filtering and sorting
+  const datedNews = newsToReturn.map(item => ({ item, time: new Date(item.pubDate).getTime() }));
+  const newestFirst = (a, b) => b.time - a.time;
+  
+  // Filter for last 24 hours before sorting, newest first
+  const yesterday = Date.now() - 24 * 60 * 60 * 1000;
+  const recentNews = datedNews.filter(entry => entry.time > yesterday).sort(newestFirst);
+  
+  // If no recent news, return the newest available news (fallback)
+  const finalNews = recentNews.length > 0 ? recentNews : datedNews.sort(newestFirst).slice(0, 20);
+  return finalNews.map(entry => entry.item);
+}
+
+// In-memory cache so repeated and concurrent requests share one feed fetch
+const NEWS_CACHE_TTL = 60 * 1000;
+const newsCache = { news: null, fetchedAt: 0, pending: null };
+
+async function getCachedFinanceNews() {
+  if (newsCache.news && Date.now() - newsCache.fetchedAt < NEWS_CACHE_TTL) {
+    return newsCache.news;
+  }
+  
+  if (!newsCache.pending) {
+    newsCache.pending = getFinanceNews()
+      .then(news => {
+        newsCache.news = news;
+        newsCache.fetchedAt = Date.now();
+        return news;
+      })
+      .finally(() => {
+        newsCache.pending = null;
+      });
+  }
+  
+  return newsCache.pending;
 }
 
 // API endpoint to get news
 app.get('/api/news', async (req, res) => {
   try {
-    const allNews = [];
-    
-    // Fetch from all RSS feeds
-    for (const [source, url] of Object.entries(RSS_FEEDS)) {
-      const sourceName = source.charAt(0).toUpperCase() + source.slice(1);
-      const news = await parseRSSFeed(url, sourceName);
-      allNews.push(...news);
-    }
-    
-    // Filter for finance-related news only
-    const financeNews = allNews.filter(item => 
-      isFinanceRelated(item.title, item.summary)
-    );
-    
-    // If no news fetched, use mock data
-    const newsToReturn = financeNews.length > 0 ? financeNews : MOCK_NEWS;
-    
-    // Sort by publication date (newest first)
-    newsToReturn.sort((a, b) => new Date(b.pubDate) - new Date(a.pubDate));
-    
-    // Filter for last 24 hours
-    const yesterday = new Date(Date.now() - 24 * 60 * 60 * 1000);
-    const recentNews = newsToReturn.filter(item => 
-      new Date(item.pubDate) > yesterday
-    );
-    
-    // If no recent news, return all available news (fallback)
-    const finalNews = recentNews.length > 0 ? recentNews : newsToReturn.slice(0, 20);
+    const finalNews = await getCachedFinanceNews();
     
     res.json({
       success: true,
       count: finalNews.length,
-      news: finalNews,
-      lastUpdated: new Date().toISOString()
+      news: finalNews.map(withShortSummary),
+      lastUpdated: new Date(newsCache.fetchedAt).toISOString()
     });
     
   } catch (error) {
@@ -167,19 +244,17 @@ app.get('/api/news', async (req, res) => {
 // API endpoint for trending news (top stories)
 app.get('/api/trending', async (req, res) => {
   try {
-    const response = await fetch(`http://localhost:${PORT}/api/news`);
-    const data = await response.json();
+    const news = await getCachedFinanceNews();
     
     // Simple trending algorithm: recent + keywords importance
-    const trending = data.news
+    const trending = news
       .slice(0, 15)
       .map(item => {
         let score = 0;
         const text = (item.title + ' ' + item.summary).toLowerCase();
         
         // Score based on important keywords
-        const importantKeywords = ['sensex', 'nifty', 'rbi', 'earnings', 'ipo', 'rupee'];
-        importantKeywords.forEach(keyword => {
+        TRENDING_KEYWORDS.forEach(keyword => {
           if (text.includes(keyword)) score += 2;
         });
         
@@ -192,7 +267,8 @@ app.get('/api/trending', async (req, res) => {
         return { ...item, trendingScore: score };
       })
       .sort((a, b) => b.trendingScore - a.trendingScore)
-      .slice(0, 5);
+      .slice(0, 5)
+      .map(withShortSummary);
     
     res.json({
       success: true,